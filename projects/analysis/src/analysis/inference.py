@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING
 
 from .statistics import StatisticsCollector
 from .types import (
+    BOOLEAN_TYPE_NAMES,
     BOOLEAN_VALUE_SETS,
+    DATE_TYPE_NAMES,
+    DATETIME_TYPE_NAMES,
+    GUID_TYPE_NAMES,
+    STRING_TYPE_NAMES,
     ColumnStatistics,
     InferredType,
     TypeRecommendation,
@@ -19,6 +25,31 @@ if TYPE_CHECKING:
 MAX_SAMPLE_ROWS = StatisticsCollector.MAX_SAMPLE_ROWS
 
 
+# Every declared type name checked below, including multi-word spellings
+KNOWN_TYPE_NAMES = (
+    STRING_TYPE_NAMES
+    | GUID_TYPE_NAMES
+    | BOOLEAN_TYPE_NAMES
+    | DATE_TYPE_NAMES
+    | DATETIME_TYPE_NAMES
+)
+
+
+@cache
+def _base_type_name(type_str: str) -> str:
+    """Reduce a SQL type string to its uppercased base name.
+
+    Length arguments are dropped and the longest known multi-word spelling is
+    kept, so "NATIONAL CHARACTER VARYING(50)" stays whole. Other trailing
+    modifiers are dropped, so "TIMESTAMP WITH TIME ZONE" reduces to "TIMESTAMP".
+    """
+    words = type_str.partition("(")[0].upper().split()
+    for end in range(len(words), 1, -1):
+        if (name := " ".join(words[:end])) in KNOWN_TYPE_NAMES:
+            return name
+    return words[0] if words else ""
+
+
 class TypeInferenceEngine:
     """Infers better types from collected statistics."""
 
@@ -47,17 +78,7 @@ class TypeInferenceEngine:
             True if the type is a string type, False otherwise
 
         """
-        type_upper = type_str.upper()
-        string_types = (
-            "VARCHAR",
-            "CHAR",
-            "TEXT",
-            "STRING",
-            "CLOB",
-            "NVARCHAR",
-            "NCHAR",
-        )
-        return any(string_type in type_upper for string_type in string_types)
+        return _base_type_name(type_str) in STRING_TYPE_NAMES
 
     def infer_type(  # noqa: PLR0911
         self,
@@ -153,7 +174,9 @@ class TypeInferenceEngine:
         if stats.cardinality > self.ENUM_CARDINALITY_THRESHOLD:
             return None
 
-        if stats.cardinality_ratio > self.ENUM_CARDINALITY_RATIO:
+        # Read the derived ratio once; it is reused for the evidence below
+        cardinality_ratio = stats.cardinality_ratio
+        if cardinality_ratio > self.ENUM_CARDINALITY_RATIO:
             return None
 
         # At least minimum distinct values
@@ -172,9 +195,9 @@ class TypeInferenceEngine:
             evidence={
                 "cardinality": stats.cardinality,
                 "total_rows": stats.total_rows,
-                "cardinality_ratio": round(stats.cardinality_ratio, 4),
+                "cardinality_ratio": round(cardinality_ratio, 4),
             },
-            enum_values={str(v) for v in stats.value_counts},
+            enum_values=tuple(sorted({str(v) for v in stats.value_counts})),
         )
 
     def _infer_boolean(
@@ -190,8 +213,7 @@ class TypeInferenceEngine:
         """
         # Skip columns already typed as boolean - this is trivial
         # Common database types: BOOLEAN, BOOL, BIT, YESNO (Access)
-        type_lower = current_type.lower()
-        if "bool" in type_lower or "bit" in type_lower or "yesno" in type_lower:
+        if _base_type_name(current_type) in BOOLEAN_TYPE_NAMES:
             return None
 
         # Must have exactly 2 unique values
@@ -252,8 +274,7 @@ class TypeInferenceEngine:
         Filters out trivial cases where type is already a date type.
         """
         # Skip columns already typed as date - this is trivial
-        type_lower = current_type.lower()
-        if "date" in type_lower and "datetime" not in type_lower:
+        if _base_type_name(current_type) in DATE_TYPE_NAMES:
             return None
 
         if stats.date_pattern_matches == 0:
@@ -298,8 +319,7 @@ class TypeInferenceEngine:
         Filters out trivial cases where type is already a datetime/timestamp type.
         """
         # Skip columns already typed as datetime/timestamp - this is trivial
-        type_lower = current_type.lower()
-        if "datetime" in type_lower or "timestamp" in type_lower:
+        if _base_type_name(current_type) in DATETIME_TYPE_NAMES:
             return None
 
         if stats.datetime_pattern_matches == 0:
@@ -348,12 +368,7 @@ class TypeInferenceEngine:
         """
         # Skip columns already typed as GUID/UUID - this is trivial
         # Common database types: GUID, UNIQUEIDENTIFIER (SQL Server), UUID (PostgreSQL)
-        type_lower = current_type.lower()
-        if (
-            "guid" in type_lower
-            or "uuid" in type_lower
-            or "uniqueidentifier" in type_lower
-        ):
+        if _base_type_name(current_type) in GUID_TYPE_NAMES:
             return None
 
         if stats.uuid_pattern_matches == 0:
@@ -4,12 +4,12 @@ from __future__ import annotations
 
 import json
 from collections import defaultdict
-from dataclasses import asdict
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Literal
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from sqlalchemy import create_engine, inspect
+from sqlalchemy.pool import NullPool
 
 from .inference import TypeInferenceEngine
 from .reporting import TEMPLATE_DIR, json_default
@@ -22,7 +22,7 @@ if TYPE_CHECKING:
 
     from sqlalchemy.engine import Engine
 
-    from .types import TypeRecommendation
+    from .types import InferredType, TypeRecommendation
 
 # Display limits for markdown reports
 MAX_RECOMMENDATIONS_DISPLAY = 20
@@ -69,14 +69,10 @@ def create_engine_for_database(database: Path) -> Engine:
     """
     suffix = database.suffix.lower()
 
-    # Connection pool configuration for better resource management
+    # SQLite file connections are cheap to open and there is no server round
+    # trip to save, so connections are not pooled
     if suffix in {".sqlite", ".db", ".sqlite3"}:
-        return create_engine(
-            f"sqlite:///{database}",
-            pool_size=5,  # Maintain 5 connections in pool
-            max_overflow=10,  # Allow up to 10 additional connections
-            pool_pre_ping=True,  # Verify connections before use
-        )
+        return create_engine(f"sqlite:///{database}", poolclass=NullPool)
 
     if suffix in {".mdb", ".accdb"}:
         abs_path = database.resolve()
@@ -110,10 +106,9 @@ def analyze_database(
     collector = StatisticsCollector(engine)
     inference_engine = TypeInferenceEngine()
 
-    # Analyze all tables and columns
+    # Analyze all tables and columns, as their statistics are collected
     def analyze_tables() -> Iterator[TypeRecommendation]:
-        for table_name in collector.metadata.tables:
-            table_stats = collector.collect_table_statistics(table_name)
+        for table_name, table_stats in collector.iter_table_statistics():
             table = collector.metadata.tables[table_name]
 
             for column in table.columns:
@@ -143,8 +138,8 @@ def report_to_json(report: AnalysisReport) -> str:
         JSON string representation
 
     """
-    report_dict = asdict(report)
-    return json.dumps(report_dict, indent=2, default=json_default)
+    # json_default expands dataclasses as the encoder reaches them
+    return json.dumps(report, indent=2, default=json_default)
 
 
 def generate_report(
@@ -187,11 +182,13 @@ def report_to_markdown(report: AnalysisReport) -> str:
     template = _JINJA_ENV.get_template("report.md")
 
     # Group recommendations by type and sort by confidence
-    recommendations_by_type: defaultdict[str, list[TypeRecommendation]] = defaultdict(
-        list,
-    )
+    # InferredType is a StrEnum, so members key the groups without unwrapping .value
+    recommendations_by_type: defaultdict[
+        InferredType,
+        list[TypeRecommendation],
+    ] = defaultdict(list)
     for rec in report.recommendations:
-        recommendations_by_type[rec.inferred_type.value].append(rec)
+        recommendations_by_type[rec.inferred_type].append(rec)
 
     for recs in recommendations_by_type.values():
         recs.sort(key=lambda r: r.confidence, reverse=True)
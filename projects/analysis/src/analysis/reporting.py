@@ -2,25 +2,30 @@
 
 from __future__ import annotations
 
+from dataclasses import fields, is_dataclass
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from _typeshed import DataclassInstance
 
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
 
-def json_default(obj: object) -> list[str]:
+@cache
+def _field_names(cls: type[DataclassInstance]) -> tuple[str, ...]:
+    """Return the field names of a dataclass type, introspected once per type."""
+    return tuple(field.name for field in fields(cls))
+
+
+def json_default(obj: object) -> dict[str, Any]:
     """Convert non-serializable objects for JSON encoding.
 
-    Handles conversion of set objects to sorted lists of strings.
-    Since str() accepts any object, no type narrowing is needed.
+    Dataclass instances become a shallow dict of their fields, so a report is
+    serialized in one pass by the encoder without an intermediate copy.
     """
-    if isinstance(obj, set):
-        # Convert each item to string - str() accepts any type
-        # Type checkers can't infer the set's item type from isinstance alone,
-        # but str() is safe for any object type
-        return (
-            sorted(str(item) for item in obj)  # pyright: ignore[reportUnknownArgumentType,reportUnknownVariableType]
-            if obj
-            else []
-        )
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {name: getattr(obj, name) for name in _field_names(type(obj))}
     msg = f"Object of type {type(obj)} is not JSON serializable"
     raise TypeError(msg)
@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import re
-import uuid
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import MetaData, func, select
+from sqlalchemy import MetaData, distinct, func, select
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from sqlalchemy.engine import Engine
 
 from .types import (
@@ -40,6 +45,58 @@ DATETIME_FORMAT_PATTERNS = {
     ),  # DD/MM/YYYY HH:MM:SS
 }
 
+# UUID pattern: 32 hex digits, hyphenated 8-4-4-4-12 or not, optionally braced
+# Matches the common spellings uuid.UUID accepts without raising per mismatch
+UUID_PATTERN = re.compile(
+    r"(?:urn:uuid:)?\{?[0-9a-fA-F]{8}(-?)[0-9a-fA-F]{4}\1[0-9a-fA-F]{4}"
+    r"\1[0-9a-fA-F]{4}\1[0-9a-fA-F]{12}\}?",
+)
+
+# Format labels for values that are already typed or not matched by regex
+NATIVE_DATE_FORMAT = "date"
+NATIVE_DATETIME_FORMAT = "datetime"
+UUID_FORMAT = "uuid"
+
+
+# Dialects without COUNT(DISTINCT ...) support, counted via DISTINCT subqueries
+SUBQUERY_DISTINCT_DIALECTS = frozenset({"access"})
+
+
+class _SampleReservoir:
+    """Bottom-k sample of distinct values, chosen by a stable hash of each value.
+
+    Keeping the values with the smallest hashes makes the sample independent of
+    row order, so the scan feeding it needs no ORDER BY to be reproducible.
+    """
+
+    __slots__ = ("_largest", "_values", "size")
+
+    def __init__(self, size: int) -> None:
+        """Initialize an empty reservoir holding at most size values."""
+        self.size = size
+        # Keyed by (hash, repr) so values whose hashes collide stay distinct
+        self._values: dict[tuple[int, str], Any] = {}
+        self._largest: tuple[int, str] | None = None
+
+    def offer(self, value: Any) -> None:  # noqa: ANN401
+        """Keep value if its hash is among the smallest seen so far."""
+        text = repr(value)
+        # crc32 is stable across processes, unlike hash() of str
+        key = (zlib.crc32(text.encode()), text)
+        if key in self._values:
+            return
+        if self._largest is not None:
+            if key >= self._largest:
+                return
+            del self._values[self._largest]
+        self._values[key] = value
+        if len(self._values) >= self.size:
+            self._largest = max(self._values)
+
+    def samples(self) -> list[Any]:
+        """Return the kept values ordered by hash."""
+        return [self._values[key] for key in sorted(self._values)]
+
 
 class StatisticsCollector:
     """Collects statistics from a database table."""
@@ -56,12 +113,69 @@ class StatisticsCollector:
     # Maximum rows to sample for pattern matching (memory optimization)
     MAX_SAMPLE_ROWS = 10000
 
+    # Maximum tables collected concurrently, each on its own connection
+    MAX_WORKERS = 4
+
     def __init__(self, engine: Engine) -> None:
         """Initialize with database engine."""
         self.engine = engine
         self.metadata = MetaData()
         self.metadata.reflect(bind=engine)
 
+    def collect_all_table_statistics(
+        self,
+        table_names: Iterable[str] | None = None,
+    ) -> dict[str, dict[str, ColumnStatistics]]:
+        """Collect statistics for several tables, keyed by table name."""
+        return dict(self.iter_table_statistics(table_names))
+
+    def iter_table_statistics(
+        self,
+        table_names: Iterable[str] | None = None,
+    ) -> Iterator[tuple[str, dict[str, ColumnStatistics]]]:
+        """Yield (table name, statistics) pairs, collecting tables concurrently.
+
+        Tables are independent and mostly wait on the database driver, which
+        releases the GIL while executing, so they are spread over a thread pool.
+        At most MAX_WORKERS tables are in flight, so only their statistics are
+        held until the caller consumes them. Pairs keep the order of table_names
+        (all reflected tables by default).
+
+        Engines that hand every thread the same in-memory database (or one
+        connection per thread to a private one) are collected serially.
+
+        """
+        names = list(self.metadata.tables if table_names is None else table_names)
+        if not self._connections_shareable():
+            for name in names:
+                yield name, self.collect_table_statistics(name)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            pending: deque[tuple[str, Future[dict[str, ColumnStatistics]]]] = deque()
+            for name in names:
+                pending.append(
+                    (name, executor.submit(self.collect_table_statistics, name)),
+                )
+                if len(pending) >= self.MAX_WORKERS:
+                    done_name, future = pending.popleft()
+                    yield done_name, future.result()
+            while pending:
+                done_name, future = pending.popleft()
+                yield done_name, future.result()
+
+    def _connections_shareable(self) -> bool:
+        """Check whether worker threads can each use their own connection."""
+        # SingletonThreadPool gives each thread a fresh (empty) in-memory database,
+        # StaticPool shares one connection that must not be used concurrently
+        if isinstance(self.engine.pool, SingletonThreadPool | StaticPool):
+            return False
+        url = self.engine.url
+        return not (
+            url.get_backend_name() == "sqlite"
+            and url.database in {None, "", ":memory:"}
+        )
+
     def collect_table_statistics(
         self,
         table_name: str,
@@ -73,10 +187,11 @@ class StatisticsCollector:
             # Step 1: Use SQL aggregation for basic statistics
             column_stats = self._collect_basic_statistics(conn, table)
 
-            # Step 2: Use SQL aggregation for value counts (low cardinality columns)
-            self._collect_value_counts(conn, table, column_stats)
+            # Step 2: Use SQL aggregation for value counts and samples
+            # (low cardinality columns)
+            self._collect_value_distribution(conn, table, column_stats)
 
-            # Step 3: Sample rows for pattern matching and samples
+            # Step 3: Sample rows for pattern matching and remaining samples
             self._collect_patterns_and_samples(conn, table, column_stats)
 
         return column_stats
@@ -89,7 +204,12 @@ class StatisticsCollector:
         """Collect basic statistics using a single SQL query with multiple aggregations.
 
         This optimization reduces database round-trips from 2N+1 to 1 query.
-        For a 50-column table: 101 queries → 1 query.
+        For a 50-column table: 101 queries → 1 query. Where the dialect supports
+        COUNT(DISTINCT ...), the whole query is a single scan of the table.
+
+        Unique counts are capped at MAX_UNIQUE_TRACKING. Dialects that need a
+        DISTINCT subquery per column already pay one scan per column, so each
+        subquery stops as soon as it exceeds the cap.
 
         """
         # Build single query with all aggregations
@@ -104,21 +224,31 @@ class StatisticsCollector:
             for column in table.columns
         )
 
-        # Add unique count for each column using subquery approach
-        # (Access doesn't support COUNT(DISTINCT ...) so we use a subquery)
-        for column in table.columns:
+        # Add unique count for each column
+        if conn.dialect.name in SUBQUERY_DISTINCT_DIALECTS:
             # COUNT(*) FROM (SELECT DISTINCT col FROM tbl WHERE col IS NOT NULL)
-            distinct_subq = (
-                select(column)
-                .select_from(table)
-                .where(column.isnot(None))
-                .distinct()
-                .subquery()
-            )
-            unique_count_subq = (
-                select(func.count()).select_from(distinct_subq).scalar_subquery()
+            # The LIMIT never changes the capped count, it only ends the scan early
+            for column in table.columns:
+                distinct_subq = (
+                    select(column)
+                    .select_from(table)
+                    .where(column.isnot(None))
+                    .distinct()
+                    .limit(self.MAX_UNIQUE_TRACKING + 1)
+                    .subquery()
+                )
+                unique_count_subq = (
+                    select(func.count()).select_from(distinct_subq).scalar_subquery()
+                )
+                aggregations.append(
+                    unique_count_subq.label(f"{column.name}__unique"),
+                )
+        else:
+            # COUNT(DISTINCT col) ignores NULLs and is evaluated in the same scan
+            aggregations.extend(
+                func.count(distinct(column)).label(f"{column.name}__unique")
+                for column in table.columns
             )
-            aggregations.append(unique_count_subq.label(f"{column.name}__unique"))
 
         # Execute single query with all aggregations
         query = select(*aggregations).select_from(table)
@@ -143,13 +273,18 @@ class StatisticsCollector:
 
         return column_stats
 
-    def _collect_value_counts(
+    def _collect_value_distribution(
         self,
         conn: Any,  # noqa: ANN401
         table: Any,  # noqa: ANN401
         column_stats: dict[str, ColumnStatistics],
     ) -> None:
-        """Collect value counts for low-cardinality columns using SQL."""
+        """Collect value counts and samples for low-cardinality columns using SQL.
+
+        The grouped query returns every distinct value of these columns, so the
+        most frequent values double as samples and the row scan can skip them.
+
+        """
         for column in table.columns:
             stats = column_stats[column.name]
 
@@ -163,12 +298,14 @@ class StatisticsCollector:
                 .select_from(table)
                 .where(column.isnot(None))
                 .group_by(column)
-                .order_by(func.count().desc())
+                .order_by(func.count().desc(), column)
                 .limit(self.MAX_VALUE_COUNTS)
             )
+            rows = conn.execute(query).all()
 
-            result = conn.execute(query)
-            stats.value_counts = {row[0]: row[1] for row in result}
+            # Counts are already aggregated, so feed them in as a mapping
+            stats.value_counts.update(dict(rows))
+            stats.value_samples = [row[0] for row in rows[: self.MAX_SAMPLES]]
 
     def _collect_patterns_and_samples(
         self,
@@ -176,19 +313,25 @@ class StatisticsCollector:
         table: Any,  # noqa: ANN401
         column_stats: dict[str, ColumnStatistics],
     ) -> None:
-        """Collect pattern matches and samples by iterating over sampled rows."""
+        """Collect pattern matches and samples by iterating over sampled rows.
+
+        Samples are only gathered here for columns too diverse for value counts.
+
+        """
         # Sample rows for pattern matching (memory optimization)
         # For large tables, only analyze a sample instead of all rows
-        # Order by primary key for deterministic, reproducible sampling
         query = table.select().limit(self.MAX_SAMPLE_ROWS)
 
-        # Add ORDER BY for deterministic sampling
-        if table.primary_key.columns:
-            # Order by primary key columns for consistency
-            query = query.order_by(*table.primary_key.columns)
-        else:
-            # Fallback: order by first column if no primary key
-            query = query.order_by(table.columns[0])
+        # Order only matters when the scan is truncated: pattern counts over all
+        # rows and hash-chosen samples do not depend on row order
+        total_rows = column_stats[table.columns[0].name].total_rows
+        if total_rows > self.MAX_SAMPLE_ROWS:
+            if table.primary_key.columns:
+                # Order by primary key columns for consistency
+                query = query.order_by(*table.primary_key.columns)
+            else:
+                # Fallback: order by first column if no primary key
+                query = query.order_by(table.columns[0])
 
         result = conn.execute(query)
 
@@ -196,8 +339,12 @@ class StatisticsCollector:
         # Avoids redundant _asdict() calls in the hot loop
         column_indices = {col.name: idx for idx, col in enumerate(table.columns)}
 
-        # Use sets for O(1) lookup during sample collection
-        sample_sets: dict[str, set[Any]] = {col.name: set() for col in table.columns}
+        # Reservoirs keep a bounded, order-independent sample per column
+        reservoirs = {
+            col.name: _SampleReservoir(self.MAX_SAMPLES)
+            for col in table.columns
+            if column_stats[col.name].unique_count > self.MAX_VALUE_COUNTS
+        }
 
         for row in result:
             # Use direct tuple indexing instead of converting to dict
@@ -209,16 +356,17 @@ class StatisticsCollector:
                 if value is None:
                     continue
 
-                # Collect samples using set for O(1) lookup
-                if len(sample_sets[col_name]) < self.MAX_SAMPLES:
-                    sample_sets[col_name].add(value)
+                # Offer the value to the column's sample reservoir
+                reservoir = reservoirs.get(col_name)
+                if reservoir is not None:
+                    reservoir.offer(value)
 
                 # Pattern matching
                 self._analyze_value_patterns(stats, value)
 
-        # Convert sets to lists for final storage
-        for col_name, sample_set in sample_sets.items():
-            column_stats[col_name].value_samples = list(sample_set)
+        # Convert reservoirs to lists for final storage
+        for col_name, reservoir in reservoirs.items():
+            column_stats[col_name].value_samples = reservoir.samples()
 
     def _analyze_value_patterns(
         self,
@@ -233,12 +381,14 @@ class StatisticsCollector:
         # Date/DateTime detection
         if isinstance(value, datetime):
             stats.datetime_pattern_matches += 1
-            stats.detected_formats["datetime"] = (
-                stats.detected_formats.get("datetime", 0) + 1
+            stats.detected_formats[NATIVE_DATETIME_FORMAT] = (
+                stats.detected_formats.get(NATIVE_DATETIME_FORMAT, 0) + 1
             )
         elif isinstance(value, date):
             stats.date_pattern_matches += 1
-            stats.detected_formats["date"] = stats.detected_formats.get("date", 0) + 1
+            stats.detected_formats[NATIVE_DATE_FORMAT] = (
+                stats.detected_formats.get(NATIVE_DATE_FORMAT, 0) + 1
+            )
 
         # String-based pattern matching
         if isinstance(value, str):
@@ -257,51 +407,35 @@ class StatisticsCollector:
         # UUID pattern detection
         if self._is_uuid_format(value):
             stats.uuid_pattern_matches += 1
-            stats.detected_formats["uuid"] = stats.detected_formats.get("uuid", 0) + 1
+            stats.detected_formats[UUID_FORMAT] = (
+                stats.detected_formats.get(UUID_FORMAT, 0) + 1
+            )
 
         # Boolean string detection
         if value.lower() in BOOLEAN_STRING_VALUES:
             stats.boolean_pattern_matches += 1
 
         # Date pattern detection (various formats)
-        if self._is_date_format(value):
+        # Format names are the pattern dict keys, so matching and labelling is one scan
+        detected_format = self._detect_date_format(value)
+        if detected_format:
             stats.date_pattern_matches += 1
-            detected_format = self._detect_date_format(value)
-            if detected_format:
-                stats.detected_formats[detected_format] = (
-                    stats.detected_formats.get(detected_format, 0) + 1
-                )
+            stats.detected_formats[detected_format] = (
+                stats.detected_formats.get(detected_format, 0) + 1
+            )
 
         # DateTime pattern detection
-        if self._is_datetime_format(value):
+        detected_format = self._detect_datetime_format(value)
+        if detected_format:
             stats.datetime_pattern_matches += 1
-            detected_format = self._detect_datetime_format(value)
-            if detected_format:
-                stats.detected_formats[detected_format] = (
-                    stats.detected_formats.get(detected_format, 0) + 1
-                )
+            stats.detected_formats[detected_format] = (
+                stats.detected_formats.get(detected_format, 0) + 1
+            )
 
     @staticmethod
     def _is_uuid_format(value: str) -> bool:
         """Check if string matches UUID format."""
-        try:
-            uuid.UUID(value)
-        except (ValueError, AttributeError):
-            return False
-        else:
-            return True
-
-    @staticmethod
-    def _is_date_format(value: str) -> bool:
-        """Check if string matches common date formats."""
-        return any(pattern.match(value) for pattern in DATE_FORMAT_PATTERNS.values())
-
-    @staticmethod
-    def _is_datetime_format(value: str) -> bool:
-        """Check if string matches common datetime formats."""
-        return any(
-            pattern.match(value) for pattern in DATETIME_FORMAT_PATTERNS.values()
-        )
+        return UUID_PATTERN.fullmatch(value) is not None
 
     @staticmethod
     def _detect_date_format(value: str) -> str | None:
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections import Counter
 from dataclasses import dataclass, field
 from enum import StrEnum, auto
+from operator import attrgetter
 from typing import Any
 
 
@@ -14,9 +15,9 @@ def _default_list_any() -> list[Any]:
     return []
 
 
-def _default_dict_any_int() -> dict[Any, int]:
-    """Create empty dict mapping Any to int."""
-    return {}
+def _default_counter_any() -> Counter[Any]:
+    """Create empty counter for Any-typed values."""
+    return Counter()
 
 
 def _default_dict_str_int() -> dict[str, int]:
@@ -49,15 +50,65 @@ BOOLEAN_VALUE_SETS = [set(pair) for pair in BOOLEAN_VALUE_PAIRS] + [
 ]
 
 # Derive flattened string values for efficient pattern matching
-BOOLEAN_STRING_VALUES = {str(v).lower() for pair in BOOLEAN_VALUE_PAIRS for v in pair}
+BOOLEAN_STRING_VALUES = frozenset(
+    str(v).lower() for pair in BOOLEAN_VALUE_PAIRS for v in pair
+)
 
 # Derive numeric values for detection
-BOOLEAN_NUMERIC_VALUES = {
+BOOLEAN_NUMERIC_VALUES = frozenset(
     v
     for pair in BOOLEAN_VALUE_PAIRS
     if all(isinstance(x, int) for x in pair)
     for v in pair
-}
+)
+
+# Base SQL type names (uppercased, without length or modifiers) per type family
+# Columns already declared with one of these types are skipped by inference
+STRING_TYPE_NAMES = frozenset(
+    {
+        "VARCHAR",
+        "VARCHAR2",
+        "NVARCHAR",
+        "NVARCHAR2",
+        "CHAR",
+        "NCHAR",
+        "CHARACTER",
+        "LONGCHAR",  # Access memo
+        "TEXT",
+        "NTEXT",
+        "TINYTEXT",
+        "MEDIUMTEXT",
+        "LONGTEXT",
+        "STRING",
+        "CLOB",
+        "NCLOB",
+        "LONGVARCHAR",
+        "LONGNVARCHAR",
+        # Multi-word spellings whose first word alone is not a string type
+        "NATIONAL CHARACTER",
+        "NATIONAL CHARACTER VARYING",
+        "NATIONAL CHAR",
+        "NATIONAL CHAR VARYING",
+        "NATIONAL VARCHAR",
+        "NATIVE CHARACTER",
+        "VARYING CHARACTER",
+        "LONG VARCHAR",
+        "LONG NVARCHAR",
+    },
+)
+GUID_TYPE_NAMES = frozenset({"GUID", "UNIQUEIDENTIFIER", "UUID"})
+BOOLEAN_TYPE_NAMES = frozenset({"BOOLEAN", "BOOL", "BIT", "YESNO"})
+DATE_TYPE_NAMES = frozenset({"DATE"})
+DATETIME_TYPE_NAMES = frozenset(
+    {
+        "DATETIME",
+        "DATETIME2",
+        "SMALLDATETIME",
+        "DATETIMEOFFSET",
+        "TIMESTAMP",
+        "TIMESTAMPTZ",
+    },
+)
 
 
 class InferredType(StrEnum):
@@ -70,7 +121,7 @@ class InferredType(StrEnum):
     UUID = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnStatistics:
     """Statistics collected for a single column during analysis."""
 
@@ -83,7 +134,7 @@ class ColumnStatistics:
     value_samples: list[Any] = field(default_factory=_default_list_any)
 
     # Value distribution (for enum detection)
-    value_counts: dict[Any, int] = field(default_factory=_default_dict_any_int)
+    value_counts: Counter[Any] = field(default_factory=_default_counter_any)
 
     # Pattern matching counters
     date_pattern_matches: int = 0
@@ -119,7 +170,7 @@ class ColumnStatistics:
         return self.unique_count / self.non_null_count
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TypeRecommendation:
     """A recommendation for type refinement."""
 
@@ -130,20 +181,20 @@ class TypeRecommendation:
     confidence: float  # 0.0 to 1.0
     evidence: dict[str, Any] = field(default_factory=_default_dict_str_any)
 
-    # Type-specific data
-    enum_values: set[str] | None = None
+    # Type-specific data, enum values are stored sorted so output needs no sort
+    enum_values: tuple[str, ...] | None = None
     detected_format: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReportSummary:
     """Summary statistics for an analysis report."""
 
     total_recommendations: int
-    by_type: dict[str, int]
+    by_type: dict[InferredType, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisReport:
     """Complete analysis report with type recommendations."""
 
@@ -153,10 +204,13 @@ class AnalysisReport:
     summary: ReportSummary = field(init=False)
 
     def __post_init__(self) -> None:
-        """Compute summary from recommendations."""
-        by_type = Counter(rec.inferred_type for rec in self.recommendations)
+        """Compute summary from recommendations in a single pass."""
+        # Counter tallies in C; the summary lists types in declaration order
+        counts = Counter(map(attrgetter("inferred_type"), self.recommendations))
 
         self.summary = ReportSummary(
             total_recommendations=len(self.recommendations),
-            by_type={str(k): v for k, v in by_type.items()},
+            by_type={
+                member: counts[member] for member in InferredType if member in counts
+            },
         )
@@ -1,12 +1,19 @@
 """Tests for type inference engine."""
 
+import pytest
+
 from analysis.inference import TypeInferenceEngine
 from analysis.types import ColumnStatistics, InferredType
 
 
-def test_infer_enum_low_cardinality() -> None:
+@pytest.fixture(name="engine", scope="module")
+def create_inference_engine() -> TypeInferenceEngine:
+    """Shared inference engine; it holds no per-call state."""
+    return TypeInferenceEngine()
+
+
+def test_infer_enum_low_cardinality(engine: TypeInferenceEngine) -> None:
     """Test enum detection with low cardinality."""
-    engine = TypeInferenceEngine()
     stats = ColumnStatistics(
         total_rows=1000,
         null_count=0,
@@ -19,12 +26,11 @@ def test_infer_enum_low_cardinality() -> None:
     assert result is not None
     assert result.inferred_type == InferredType.ENUM
     assert result.confidence > 0.7
-    assert result.enum_values == {"active", "inactive", "pending"}
+    assert result.enum_values == ("active", "inactive", "pending")
 
 
-def test_infer_enum_too_high_cardinality() -> None:
+def test_infer_enum_too_high_cardinality(engine: TypeInferenceEngine) -> None:
     """Test that high cardinality columns are not inferred as enums."""
-    engine = TypeInferenceEngine()
     stats = ColumnStatistics(
         total_rows=1000,
         null_count=0,
@@ -37,9 +43,8 @@ def test_infer_enum_too_high_cardinality() -> None:
     assert result is None or result.inferred_type != InferredType.ENUM
 
 
-def test_infer_boolean_binary_values() -> None:
+def test_infer_boolean_binary_values(engine: TypeInferenceEngine) -> None:
     """Test boolean detection with binary values."""
-    engine = TypeInferenceEngine()
     stats = ColumnStatistics(
         total_rows=1000,
         null_count=0,
@@ -55,9 +60,8 @@ def test_infer_boolean_binary_values() -> None:
     assert result.confidence >= 0.7
 
 
-def test_infer_boolean_numeric() -> None:
+def test_infer_boolean_numeric(engine: TypeInferenceEngine) -> None:
     """Test boolean detection with 0/1 values."""
-    engine = TypeInferenceEngine()
     stats = ColumnStatistics(
         total_rows=1000,
         null_count=0,
@@ -72,9 +76,8 @@ def test_infer_boolean_numeric() -> None:
     assert result.inferred_type == InferredType.BOOLEAN
 
 
-def test_infer_boolean_not_boolean_like() -> None:
+def test_infer_boolean_not_boolean_like(engine: TypeInferenceEngine) -> None:
     """Test that non-boolean binary columns are not inferred as boolean."""
-    engine = TypeInferenceEngine()
     stats = ColumnStatistics(
         total_rows=1000,
         null_count=0,
@@ -88,9 +91,8 @@ def test_infer_boolean_not_boolean_like() -> None:
     assert result is None or result.inferred_type != InferredType.BOOLEAN
 
 
-def test_infer_uuid() -> None:
+def test_infer_uuid(engine: TypeInferenceEngine) -> None:
     """Test UUID detection."""
-    engine = TypeInferenceEngine()
     stats = ColumnStatistics(
         total_rows=1000,
         null_count=0,
@@ -105,9 +107,8 @@ def test_infer_uuid() -> None:
     assert result.confidence >= 0.95
 
 
-def test_no_inference_empty_data() -> None:
+def test_no_inference_empty_data(engine: TypeInferenceEngine) -> None:
     """Test that empty columns return no inference."""
-    engine = TypeInferenceEngine()
     stats = ColumnStatistics(
         total_rows=1000,
         null_count=1000,  # All nulls
@@ -119,34 +120,8 @@ def test_no_inference_empty_data() -> None:
     assert result is None
 
 
-def test_guid_columns_filtered_from_uuid_analysis() -> None:
-    """Test that columns with GUID/UUID type are not identified as UUIDs."""
-    engine = TypeInferenceEngine()
-    stats = ColumnStatistics(
-        total_rows=1000,
-        null_count=0,
-        unique_count=1000,
-        uuid_pattern_matches=1000,  # 100% UUID pattern match
-    )
-
-    # Test various GUID/UUID type names from different databases:
-    # Access/SQL Server use GUID/UNIQUEIDENTIFIER, PostgreSQL uses UUID
-    guid_types = [
-        "GUID",
-        "guid",
-        "UNIQUEIDENTIFIER",
-        "uniqueidentifier",
-        "UUID",
-        "uuid",
-    ]
-    for type_name in guid_types:
-        result = engine.infer_type("users", "id", type_name, stats)
-        assert result is None, f"Type {type_name} should be filtered from UUID analysis"
-
-
-def test_non_guid_types_still_identified_as_uuid() -> None:
+def test_non_guid_types_still_identified_as_uuid(engine: TypeInferenceEngine) -> None:
     """Test that non-GUID types with UUID patterns are still identified."""
-    engine = TypeInferenceEngine()
     stats = ColumnStatistics(
         total_rows=1000,
         null_count=0,
@@ -160,29 +135,8 @@ def test_non_guid_types_still_identified_as_uuid() -> None:
     assert result.inferred_type == InferredType.UUID
 
 
-def test_integer_columns_not_inferred_as_enum() -> None:
-    """Test that integer columns with low cardinality are not inferred as enums."""
-    engine = TypeInferenceEngine()
-    stats = ColumnStatistics(
-        total_rows=1000,
-        null_count=0,
-        unique_count=3,
-        value_counts={1: 500, 2: 300, 3: 200},
-    )
-
-    # Test various integer type names
-    integer_types = ["INTEGER", "BIGINT", "SMALLINT", "INT", "TINYINT"]
-    for type_name in integer_types:
-        result = engine.infer_type("users", "status_code", type_name, stats)
-        # Should not be inferred as enum (could be boolean if values match pattern)
-        assert result is None or result.inferred_type != InferredType.ENUM, (
-            f"Type {type_name} should not be inferred as enum"
-        )
-
-
-def test_string_columns_still_inferred_as_enum() -> None:
+def test_string_columns_still_inferred_as_enum(engine: TypeInferenceEngine) -> None:
     """Test that string columns with low cardinality are still inferred as enums."""
-    engine = TypeInferenceEngine()
     stats = ColumnStatistics(
         total_rows=1000,
         null_count=0,
@@ -198,40 +152,10 @@ def test_string_columns_still_inferred_as_enum() -> None:
         assert result.inferred_type == InferredType.ENUM
 
 
-def test_boolean_types_filtered_from_boolean_analysis() -> None:
-    """Test that columns already typed as boolean are not identified as booleans."""
-    engine = TypeInferenceEngine()
-    stats = ColumnStatistics(
-        total_rows=1000,
-        null_count=0,
-        unique_count=2,
-        value_counts={0: 600, 1: 400},
-        boolean_pattern_matches=1000,
-    )
-
-    # Test various boolean type names from different databases:
-    # BOOLEAN (standard), BOOL (PostgreSQL), BIT (SQL Server), YESNO (Access)
-    boolean_types = [
-        "BOOLEAN",
-        "boolean",
-        "BOOL",
-        "bool",
-        "BIT",
-        "bit",
-        "YESNO",
-        "yesno",
-        "BIT(1)",
-    ]
-    for type_name in boolean_types:
-        result = engine.infer_type("users", "is_active", type_name, stats)
-        assert result is None, (
-            f"Type {type_name} should be filtered from boolean analysis"
-        )
-
-
-def test_non_boolean_types_still_identified_as_boolean() -> None:
+def test_non_boolean_types_still_identified_as_boolean(
+    engine: TypeInferenceEngine,
+) -> None:
     """Test that non-boolean types with boolean patterns are still identified."""
-    engine = TypeInferenceEngine()
     stats = ColumnStatistics(
         total_rows=1000,
         null_count=0,
@@ -246,55 +170,10 @@ def test_non_boolean_types_still_identified_as_boolean() -> None:
     assert result.inferred_type == InferredType.BOOLEAN
 
 
-def test_date_types_filtered_from_date_analysis() -> None:
-    """Test that columns already typed as date are not identified as dates."""
-    engine = TypeInferenceEngine()
-    stats = ColumnStatistics(
-        total_rows=1000,
-        null_count=0,
-        unique_count=365,
-        date_pattern_matches=1000,
-        detected_formats={"date:YYYY-MM-DD": 1000},
-    )
-
-    # Test various date type names
-    date_types = ["DATE", "date", "Date"]
-    for type_name in date_types:
-        result = engine.infer_type("users", "birth_date", type_name, stats)
-        assert result is None, f"Type {type_name} should be filtered from date analysis"
-
-
-def test_datetime_types_filtered_from_datetime_analysis() -> None:
-    """Test that columns already typed as datetime/timestamp are not identified."""
-    engine = TypeInferenceEngine()
-    stats = ColumnStatistics(
-        total_rows=1000,
-        null_count=0,
-        unique_count=1000,
-        datetime_pattern_matches=1000,
-        detected_formats={"datetime:YYYY-MM-DD HH:MM:SS": 1000},
-    )
-
-    # Test various datetime/timestamp type names
-    datetime_types = [
-        "DATETIME",
-        "datetime",
-        "DateTime",
-        "TIMESTAMP",
-        "timestamp",
-        "DATETIME2",
-        "TIMESTAMPTZ",
-    ]
-    for type_name in datetime_types:
-        result = engine.infer_type("users", "created_at", type_name, stats)
-        assert result is None, (
-            f"Type {type_name} should be filtered from datetime analysis"
-        )
-
-
-def test_string_types_with_date_patterns_still_identified() -> None:
+def test_string_types_with_date_patterns_still_identified(
+    engine: TypeInferenceEngine,
+) -> None:
     """Test that string types with date patterns are still identified as dates."""
-    engine = TypeInferenceEngine()
     stats = ColumnStatistics(
         total_rows=1000,
         null_count=0,
@@ -309,9 +188,10 @@ def test_string_types_with_date_patterns_still_identified() -> None:
     assert result.inferred_type == InferredType.DATE
 
 
-def test_string_types_with_datetime_patterns_still_identified() -> None:
+def test_string_types_with_datetime_patterns_still_identified(
+    engine: TypeInferenceEngine,
+) -> None:
     """Test that string types with datetime patterns are still identified."""
-    engine = TypeInferenceEngine()
     stats = ColumnStatistics(
         total_rows=1000,
         null_count=0,
@@ -324,3 +204,128 @@ def test_string_types_with_datetime_patterns_still_identified() -> None:
     result = engine.infer_type("users", "created_at", "TEXT", stats)
     assert result is not None
     assert result.inferred_type == InferredType.DATETIME
+
+
+# Statistics that would trigger each inference rule if the type were not filtered
+UUID_LIKE_STATS = ColumnStatistics(
+    total_rows=1000,
+    null_count=0,
+    unique_count=1000,
+    uuid_pattern_matches=1000,  # 100% UUID pattern match
+)
+BOOLEAN_LIKE_STATS = ColumnStatistics(
+    total_rows=1000,
+    null_count=0,
+    unique_count=2,
+    value_counts={0: 600, 1: 400},
+    boolean_pattern_matches=1000,
+)
+DATE_LIKE_STATS = ColumnStatistics(
+    total_rows=1000,
+    null_count=0,
+    unique_count=365,
+    date_pattern_matches=1000,
+    detected_formats={"date:YYYY-MM-DD": 1000},
+)
+DATETIME_LIKE_STATS = ColumnStatistics(
+    total_rows=1000,
+    null_count=0,
+    unique_count=1000,
+    datetime_pattern_matches=1000,
+    detected_formats={"datetime:YYYY-MM-DD HH:MM:SS": 1000},
+)
+
+
+@pytest.mark.parametrize(
+    ("type_name", "stats"),
+    [
+        # Access/SQL Server use GUID/UNIQUEIDENTIFIER, PostgreSQL uses UUID
+        *(
+            (type_name, UUID_LIKE_STATS)
+            for type_name in (
+                "GUID",
+                "guid",
+                "UNIQUEIDENTIFIER",
+                "uniqueidentifier",
+                "UUID",
+                "uuid",
+            )
+        ),
+        # BOOLEAN (standard), BOOL (PostgreSQL), BIT (SQL Server), YESNO (Access)
+        *(
+            (type_name, BOOLEAN_LIKE_STATS)
+            for type_name in (
+                "BOOLEAN",
+                "boolean",
+                "BOOL",
+                "bool",
+                "BIT",
+                "bit",
+                "YESNO",
+                "yesno",
+                "BIT(1)",
+            )
+        ),
+        *((type_name, DATE_LIKE_STATS) for type_name in ("DATE", "date", "Date")),
+        *(
+            (type_name, DATETIME_LIKE_STATS)
+            for type_name in (
+                "DATETIME",
+                "datetime",
+                "DateTime",
+                "TIMESTAMP",
+                "timestamp",
+                "DATETIME2",
+                "TIMESTAMPTZ",
+            )
+        ),
+    ],
+)
+def test_declared_types_filtered_from_analysis(
+    engine: TypeInferenceEngine,
+    type_name: str,
+    stats: ColumnStatistics,
+) -> None:
+    """Test that columns already declared with the inferred type are skipped."""
+    result = engine.infer_type("users", "column", type_name, stats)
+    assert result is None, f"Type {type_name} should be filtered from analysis"
+
+
+@pytest.mark.parametrize(
+    "type_name",
+    [
+        "VARCHAR(50)",
+        "nvarchar",
+        "CHARACTER VARYING(20)",
+        "NATIONAL CHARACTER VARYING(20)",
+        "national char(4)",
+        "VARYING CHARACTER(255)",
+        "NATIVE CHARACTER(70)",
+        "LONG VARCHAR",
+        "TEXT COLLATE NOCASE",
+    ],
+)
+def test_string_type_spellings(type_name: str) -> None:
+    """Test that single and multi-word string type spellings are recognized."""
+    assert TypeInferenceEngine._is_string_type(type_name)  # noqa: SLF001
+
+
+@pytest.mark.parametrize(
+    "type_name",
+    ["INTEGER", "BIGINT", "SMALLINT", "INT", "TINYINT"],
+)
+def test_integer_columns_not_inferred_as_enum(
+    engine: TypeInferenceEngine,
+    type_name: str,
+) -> None:
+    """Test that integer columns with low cardinality are not inferred as enums."""
+    stats = ColumnStatistics(
+        total_rows=1000,
+        null_count=0,
+        unique_count=3,
+        value_counts={1: 500, 2: 300, 3: 200},
+    )
+
+    result = engine.infer_type("users", "status_code", type_name, stats)
+    # Should not be inferred as enum (could be boolean if values match pattern)
+    assert result is None or result.inferred_type != InferredType.ENUM
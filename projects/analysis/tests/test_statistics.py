@@ -1,11 +1,13 @@
 """Tests for statistics collection."""
 
 import time
+from pathlib import Path
 
+import pytest
 from sqlalchemy import Column, Integer, String, create_engine, text
 from sqlalchemy.orm import declarative_base
 
-from analysis.statistics import StatisticsCollector
+from analysis.statistics import StatisticsCollector, _SampleReservoir
 
 Base = declarative_base()
 
@@ -368,3 +370,101 @@ def test_statistics_with_many_columns() -> None:
     # With single-query optimization, should complete quickly
     # Without optimization (101 queries), would be much slower
     assert elapsed < 2.0, f"Collection took {elapsed}s, expected < 2s"
+
+
+def test_high_cardinality_samples_independent_of_row_order() -> None:
+    """Test that samples of diverse columns do not depend on row order."""
+    ascending = [
+        {"id": i, "status": f"status_{i}", "category": "A", "score": i}
+        for i in range(1, 201)
+    ]
+    # Same values, stored in the opposite primary key (and scan) order
+    descending = [{**row, "id": 201 - row["id"]} for row in ascending]
+
+    samples = []
+    for ordered_rows in (ascending, descending):
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        with engine.connect() as conn:
+            conn.execute(SampleTable.__table__.insert(), ordered_rows)
+            conn.commit()
+
+        collector = StatisticsCollector(engine)
+        stats = collector.collect_table_statistics("test_table")
+        samples.append(stats["status"].value_samples)
+
+    # 200 unique values exceed MAX_VALUE_COUNTS, so samples come from the row scan
+    assert len(samples[0]) == StatisticsCollector.MAX_SAMPLES
+    assert len(set(samples[0])) == len(samples[0])
+    assert samples[0] == samples[1]
+
+
+def test_sample_reservoir_keeps_values_with_colliding_hashes() -> None:
+    """Test that distinct values sharing a crc32 are both kept."""
+    # "v29685295" and "v32060020" have the same crc32 of their repr
+    reservoir = _SampleReservoir(StatisticsCollector.MAX_SAMPLES)
+    for value in ("v29685295", "v32060020", "v29685295"):
+        reservoir.offer(value)
+
+    assert sorted(reservoir.samples()) == ["v29685295", "v32060020"]
+
+
+@pytest.mark.parametrize("subquery_dialects", [frozenset(), frozenset({"sqlite"})])
+def test_bounded_distinct_counts(
+    monkeypatch: pytest.MonkeyPatch,
+    subquery_dialects: frozenset[str],
+) -> None:
+    """Test that distinct counts stop at the cap without changing small ones."""
+    monkeypatch.setattr(
+        "analysis.statistics.SUBQUERY_DISTINCT_DIALECTS",
+        subquery_dialects,
+    )
+    monkeypatch.setattr(StatisticsCollector, "MAX_UNIQUE_TRACKING", 20)
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    with engine.connect() as conn:
+        conn.execute(
+            SampleTable.__table__.insert(),
+            [
+                {"id": i, "status": f"status_{i}", "category": f"cat_{i % 3}"}
+                for i in range(1, 150)
+            ],
+        )
+        conn.commit()
+
+    stats = StatisticsCollector(engine).collect_table_statistics("test_table")
+
+    # High-cardinality columns stop at the tracking cap
+    assert stats["id"].unique_count == 20
+    assert stats["status"].unique_count == 20
+    # Low-cardinality and all-null columns are still exact
+    assert stats["category"].unique_count == 3
+    assert stats["score"].unique_count == 0
+
+
+@pytest.mark.parametrize("in_memory", [False, True])
+def test_collect_all_table_statistics_matches_per_table(
+    tmp_path: Path,
+    *,
+    in_memory: bool,
+) -> None:
+    """Test that collecting all tables returns the same stats as one-by-one."""
+    # A file database is collected concurrently, an in-memory one serially
+    location = ":memory:" if in_memory else tmp_path / "multi.sqlite"
+    engine = create_engine(f"sqlite:///{location}")
+    with engine.connect() as conn:
+        for name in ("first", "second", "third"):
+            conn.execute(text(f"CREATE TABLE {name} (id INTEGER PRIMARY KEY, v TEXT)"))
+            conn.execute(
+                text(f"INSERT INTO {name} (id, v) VALUES (1, 'a'), (2, 'b'), (3, 'a')"),  # noqa: S608
+            )
+        conn.commit()
+
+    collector = StatisticsCollector(engine)
+    all_stats = collector.collect_all_table_statistics()
+
+    assert list(all_stats) == list(collector.metadata.tables)
+    for name, table_stats in all_stats.items():
+        assert table_stats == collector.collect_table_statistics(name)
+        assert table_stats["v"].value_counts == {"a": 2, "b": 1}
@@ -2,8 +2,8 @@
 
 import json
 from dataclasses import asdict
-from typing import Any
 
+from analysis.main import report_to_json
 from analysis.reporting import json_default
 from analysis.types import (
     AnalysisReport,
@@ -34,7 +34,7 @@ def test_column_statistics_all_null_edge_case() -> None:
 
 
 def test_type_recommendation_serializes_enum_values() -> None:
-    """Test that enum values are properly serialized and sorted."""
+    """Test that enum values serialize in their stored sorted order."""
     rec = TypeRecommendation(
         table_name="users",
         column_name="status",
@@ -42,17 +42,13 @@ def test_type_recommendation_serializes_enum_values() -> None:
         inferred_type=InferredType.ENUM,
         confidence=0.95,
         evidence={"cardinality": 3},
-        enum_values={"pending", "active", "inactive"},  # Unsorted input
+        enum_values=("active", "inactive", "pending"),
     )
 
-    # Use dict_factory to convert sets to sorted lists
-    def dict_factory(fields: list[tuple[str, Any]]) -> dict[str, Any]:
-        return {k: sorted(v) if isinstance(v, set) and v else v for k, v in fields}
+    result = asdict(rec)
 
-    result = asdict(rec, dict_factory=dict_factory)
-
-    # Enum values should be sorted in output
-    assert result["enum_values"] == ["active", "inactive", "pending"]
+    # Enum values are stored sorted, no conversion needed for output
+    assert result["enum_values"] == ("active", "inactive", "pending")
     # StrEnum remains as StrEnum (it's already a string subclass)
     assert result["inferred_type"] == InferredType.ENUM
     # Confidence is not rounded (formatting is for rendering)
@@ -69,7 +65,7 @@ def test_analysis_report_json_serialization() -> None:
         inferred_type=InferredType.ENUM,
         confidence=0.95,
         evidence={"cardinality": 3},
-        enum_values={"pending", "active", "inactive"},  # Set (unsorted)
+        enum_values=("active", "inactive", "pending"),
     )
 
     report = AnalysisReport(
@@ -94,8 +90,29 @@ def test_analysis_report_json_serialization() -> None:
     assert parsed["database"] == "test.sqlite"
     assert parsed["summary"]["total_recommendations"] == 1
     assert parsed["recommendations"][0]["table_name"] == "users"
-    # Set should be converted to sorted list
+    # Tuple is encoded as a list in stored order
     expected_enum_values = ["active", "inactive", "pending"]
     assert parsed["recommendations"][0]["enum_values"] == expected_enum_values
     # StrEnum should be preserved as string
     assert parsed["recommendations"][0]["inferred_type"] == "enum"
+
+
+def test_report_to_json_matches_asdict() -> None:
+    """Test that serializing dataclasses directly matches the asdict() output."""
+    recommendation = TypeRecommendation(
+        table_name="users",
+        column_name="status",
+        current_type="VARCHAR",
+        inferred_type=InferredType.ENUM,
+        confidence=0.95,
+        evidence={"formats": {"date_iso": 3}},
+        enum_values=("active", "pending"),
+    )
+    report = AnalysisReport(
+        database="test.sqlite",
+        generated_at="2024-01-01T00:00:00+00:00",
+        recommendations=[recommendation, recommendation],
+    )
+
+    expected = json.dumps(asdict(report), indent=2, default=json_default)
+    assert report_to_json(report) == expected
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from functools import cache
 from hashlib import sha256
 from io import BytesIO
 from logging import getLogger
 from typing import TYPE_CHECKING
 
-from requests import get
+from requests import Session
 
 if TYPE_CHECKING:
     from archive.versions import Source
@@ -15,31 +16,55 @@ if TYPE_CHECKING:
 logger = getLogger(__name__)
 
 
-def verify_checksum(data: bytes, checksum: str) -> bool:
-    """Verify the checksum of the data."""
+# Read size for streamed downloads
+CHUNK_SIZE = 1 << 16
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/96.0.4664.93 Safari/537.36"
+)
+
+
+@cache
+def _session() -> Session:
+    """Return the shared HTTP session, so repeat downloads reuse connections."""
+    session = Session()
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+def verify_checksum(digest: str, checksum: str) -> bool:
+    """Verify a hex SHA-256 digest against a "sha256:<hex>" checksum."""
     if not checksum.startswith("sha256:"):
         logger.error("Invalid checksum format: %s", checksum)
         return False
 
-    return checksum == f"sha256:{sha256(data).hexdigest()}"
+    return checksum == f"sha256:{digest}"
 
 
 def download_source(source: Source) -> BytesIO:
     """Download the zip file containing the DPM database."""
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/96.0.4664.93 Safari/537.36"
-        ),
-    }
-    response = get(source["url"], timeout=30, allow_redirects=True, headers=headers)
-    response.raise_for_status()
+    # Stream the body so it is hashed and buffered in one pass, without holding
+    # a second full copy of the archive in memory
+    hasher = sha256()
+    data = BytesIO()
+    with _session().get(
+        source["url"],
+        timeout=30,
+        allow_redirects=True,
+        stream=True,
+    ) as response:
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            hasher.update(chunk)
+            data.write(chunk)
 
     if checksum := source.get("checksum"):
-        if not verify_checksum(response.content, checksum):
+        if not verify_checksum(hasher.hexdigest(), checksum):
             logger.warning("Checksum verification failed")
     else:
         logger.warning("No checksum provided")
 
-    return BytesIO(response.content)
+    data.seek(0)
+    return data
@@ -3,11 +3,13 @@
 from collections import defaultdict
 from collections.abc import Iterable
 from datetime import date
+from functools import cache
 from pathlib import Path
 from tomllib import load
 from typing import Literal, NotRequired, TypedDict
 
 type VersionUrls = dict[str, set[str]]
+type KnownVersionUrls = dict[str, frozenset[str]]
 
 
 type VersionType = Literal["sample", "draft", "final", "release", "errata", "hotfix"]
@@ -53,11 +55,16 @@ type Versions = Iterable[Version]
 VERSION_FILE = Path(__file__).parent / "versions.toml"
 
 
-def get_versions() -> Versions:
-    """Load versions from the config file."""
+@cache
+def get_versions() -> tuple[Version, ...]:
+    """Load versions from the config file.
+
+    The file is parsed once per process; the result is an immutable tuple so the
+    cached value can be iterated any number of times and is safe to share.
+    """
     with VERSION_FILE.open("rb") as f:
-        versions: Versions = load(f)["versions"]
-        return versions
+        versions: list[Version] = load(f)["versions"]
+        return tuple(versions)
 
 
 def get_versions_by_type(versions: Versions, group: Group) -> Versions:
@@ -82,15 +89,19 @@ def get_version(versions: Versions, version_id: str) -> Version | None:
     return next((v for v in versions if v["id"] == version_id), None)
 
 
-def get_version_urls() -> VersionUrls:
-    """Get version urls from version source."""
-    versions = get_versions()
-    version_urls: VersionUrls = defaultdict(set)
-    for version in versions:
+@cache
+def get_version_urls() -> KnownVersionUrls:
+    """Get version urls from version source.
+
+    The mapping is built once per process and shared, so callers must not mutate it.
+    """
+    version_urls: defaultdict[str, list[str]] = defaultdict(list)
+    for version in get_versions():
         if original_source := version.get("original"):
-            version_urls[version["version"]].add(original_source["url"])
+            version_urls[version["version"]].append(original_source["url"])
 
-    return version_urls
+    # Deduplicate once per version into immutable sets for the shared cached value
+    return {version: frozenset(urls) for version, urls in version_urls.items()}
 
 
 def compare_version_urls(new_urls: VersionUrls) -> VersionUrls:
@@ -100,11 +111,10 @@ def compare_version_urls(new_urls: VersionUrls) -> VersionUrls:
     version, so that a URL already tracked under one version is not
     incorrectly flagged as new when it appears on a different framework page.
     """
-    version_urls = get_version_urls()
-    all_known = {url for urls in version_urls.values() for url in urls}
-
-    return {
-        version: urls - all_known
-        for version, urls in new_urls.items()
-        if urls - all_known
-    }
+    all_known: frozenset[str] = frozenset[str]().union(*get_version_urls().values())
+
+    unknown_urls: VersionUrls = {}
+    for version, urls in new_urls.items():
+        if unknown := urls - all_known:
+            unknown_urls[version] = unknown
+    return unknown_urls
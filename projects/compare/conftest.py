@@ -0,0 +1,40 @@
+"""Shared fixtures for compare tests.
+
+Kept outside the tests package, whose conftest would be imported as
+tests.conftest and clash with other projects' tests/conftest.py.
+"""
+
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from sqlite3 import Row, connect
+
+import pytest
+
+
+@pytest.fixture(name="database_factory")
+def create_database_factory(tmp_path: Path) -> Callable[..., Path]:
+    """Return a function creating a database file from DDL statements."""
+
+    def create_database(name: str, *ddl: str) -> Path:
+        location = tmp_path / name
+        connection = connect(location)
+        for statement in ddl:
+            connection.execute(statement)
+        connection.commit()
+        connection.close()
+        return location
+
+    return create_database
+
+
+@pytest.fixture(name="select_rows")
+def create_select_rows() -> Iterator[Callable[..., list[Row]]]:
+    """Return a function running a SELECT on an in-memory database."""
+    connection = connect(":memory:")
+    connection.row_factory = Row
+
+    def select_rows(sql: str, *parameters: object) -> list[Row]:
+        return connection.execute(sql, parameters).fetchall()
+
+    yield select_rows
+    connection.close()
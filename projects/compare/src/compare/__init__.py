@@ -4,6 +4,7 @@ from compare.main import (
     compare_databases,
     comparisons_to_html,
     comparisons_to_json,
+    comparisons_to_json_stream,
     comparisons_to_summary,
 )
 
@@ -11,5 +12,6 @@ __all__ = [
     "compare_databases",
     "comparisons_to_html",
     "comparisons_to_json",
+    "comparisons_to_json_stream",
     "comparisons_to_summary",
 ]
@@ -5,15 +5,22 @@ from pathlib import Path
 from sqlite3 import connect
 
 from compare.inspection import Database, Table
-from compare.query import attach
+from compare.query import attach, pragma
 
 
 class DatabaseDifference:
     """A comparison context with two databases attached for cross-database actions."""
 
+    # Page cache per attached database, negative values are KiB (64 MiB)
+    CACHE_SIZE = -65536
+    # Memory-mapped read window per attached database (256 MiB)
+    MMAP_SIZE = 1 << 28
+
     def __init__(self, old_location: Path, new_location: Path) -> None:
         """Initialize the comparison context."""
         self._connection = connect(":memory:", uri=True)
+        # EXCEPT builds temporary b-trees, keep them off disk
+        self._connection.execute(pragma("temp_store", "MEMORY"))
         self.old = self._attach_database("old", old_location)
         self.new = self._attach_database("new", new_location)
 
@@ -21,6 +28,9 @@ class DatabaseDifference:
         self._connection.execute(
             attach(f"file:{database_location}?mode=ro", database_name),
         )
+        # Both databases are scanned in full and read-only, favour large reads
+        self._connection.execute(pragma("cache_size", self.CACHE_SIZE, database_name))
+        self._connection.execute(pragma("mmap_size", self.MMAP_SIZE, database_name))
         return Database(self._connection, database_name)
 
     @property
@@ -1,6 +1,6 @@
 """Hierarchical indexing for multi-key matching."""
 
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from sqlite3 import Row
 
 type ValueType = str | int | float | None
@@ -13,47 +13,68 @@ type Indexer = Callable[[Row], IndexKeys]
 class HierarchicalIndex:
     """Index for hierarchical row matching with automatic key generation."""
 
-    def __init__(self, indexer: Indexer) -> None:
-        """Initialize the index with an indexer function."""
+    def __init__(self, indexer: Indexer, probe_indexer: Indexer | None = None) -> None:
+        """Initialize the index with an indexer function.
+
+        Rows passed to ``pop`` are keyed with ``probe_indexer`` when given, for
+        probes whose column layout differs from the indexed rows.
+        """
         self._indexer = indexer
+        self._probe_indexer = probe_indexer or indexer
         self._key_to_group_id: dict[IndexKey, int] = {}
-        self._groups: dict[int, tuple[Row, tuple[IndexKey, ...]]] = {}
-        self._next_group_id = 0
+        # Group ids are dense insertion positions into these parallel lists,
+        # popped groups leave a None row behind
+        self._group_rows: list[Row | None] = []
+        self._group_keys: list[tuple[IndexKey, ...]] = []
 
     def add(self, row: Row) -> None:
         """Add a row with semantic keys."""
         keys = tuple(self._indexer(row))
 
-        group_id = self._next_group_id
-        self._next_group_id += 1
-
-        self._groups[group_id] = (row, keys)
+        group_id = len(self._group_rows)
+        self._group_rows.append(row)
+        self._group_keys.append(keys)
 
         for key in keys:
             self._key_to_group_id[key] = group_id
 
+    def extend(self, rows: Iterable[Row]) -> None:
+        """Add many rows, with the per-row lookups hoisted out of the loop."""
+        indexer = self._indexer
+        key_to_group_id = self._key_to_group_id
+        group_rows = self._group_rows
+        group_keys = self._group_keys
+
+        for group_id, row in enumerate(rows, start=len(group_rows)):
+            keys = tuple(indexer(row))
+            group_rows.append(row)
+            group_keys.append(keys)
+            for key in keys:
+                key_to_group_id[key] = group_id
+
     def pop(self, row: Row) -> Row | None:
         """Pop first available match for the given row, trying keys in order."""
-        for key in self._indexer(row):
+        for key in self._probe_indexer(row):
             if matched_row := self._pop_by_key(key):
                 return matched_row
         return None
 
     def _pop_by_key(self, key: IndexKey) -> Row | None:
         """Pop value by specific key, removing from all keys."""
-        group_id = self._key_to_group_id.get(key)
+        group_id = self._key_to_group_id.pop(key, None)
         if group_id is None:
             return None
 
-        value, keys = self._groups.pop(group_id)
+        value = self._group_rows[group_id]
+        self._group_rows[group_id] = None
 
-        # Remove all keys in this group
-        for k in keys:
-            self._key_to_group_id.pop(k, None)
+        # Remove the remaining keys in this group, the matched one is already gone
+        for k in self._group_keys[group_id]:
+            if k != key:
+                self._key_to_group_id.pop(k, None)
 
         return value
 
     def __iter__(self) -> Iterator[Row]:
         """Iterate over all remaining unmatched rows."""
-        for row, _keys in self._groups.values():
-            yield row
+        return (row for row in self._group_rows if row is not None)
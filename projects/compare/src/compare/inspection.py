@@ -6,7 +6,14 @@ from functools import cached_property
 from sqlite3 import Connection, Row
 from typing import TYPE_CHECKING, Literal
 
-from compare.query import Query, pragma_table_info, qualified_table, select
+from compare.query import (
+    Query,
+    escape_identifier,
+    pragma_index_list,
+    pragma_table_info,
+    qualified_table,
+    select,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -64,7 +71,7 @@ class Table:
             self.name = table_name
             self.qualified_name = qualified_table(table_name, database.name)
 
-    @property
+    @cached_property
     def schema(self) -> Table:
         """Return table representing the schema of the table."""
         return Table(self._database, self.name, "schema")
@@ -75,14 +82,61 @@ class Table:
         return self._database.execute(select().from_(self.qualified_name))
 
     @cached_property
+    def _schema_info(self) -> tuple[tuple[str, ...], tuple[str, ...], bool]:
+        """Return column and primary key names from a single schema scan.
+
+        The flag tells whether every primary key column is declared NOT NULL.
+        """
+        columns: list[str] = []
+        primary_keys: list[str] = []
+        keys_not_null = True
+        for row in self.schema.rows:
+            columns.append(row["name"])
+            if row["pk"]:
+                primary_keys.append(row["name"])
+                keys_not_null = keys_not_null and bool(row["notnull"])
+        return tuple(columns), tuple(primary_keys), keys_not_null
+
+    @property
     def columns(self) -> tuple[str, ...]:
         """Return column names for this table."""
-        return tuple(row["name"] for row in self.schema.rows)
+        return self._schema_info[0]
 
-    @cached_property
+    @property
     def primary_keys(self) -> tuple[str, ...]:
         """Return primary key column names for this table."""
-        return tuple(row["name"] for row in self.schema.rows if row["pk"])
+        return self._schema_info[1]
+
+    @cached_property
+    def _distinct_keys(self) -> bool:
+        """Return whether the primary key guarantees distinct rows.
+
+        Rowid tables accept NULLs, and with them duplicate rows, in primary key
+        columns unless those are NOT NULL (always so in WITHOUT ROWID tables)
+        or the key is the rowid alias, which is the only key with no index.
+        """
+        if not self.primary_keys:
+            return False
+        if self._schema_info[2]:
+            return True
+        key_indexes = self._database.execute(
+            select()
+            .from_(pragma_index_list(self.name, self._database.name))
+            .where("origin='pk'"),
+        )
+        return next(key_indexes, None) is None
+
+    @cached_property
+    def definition(self) -> str | None:
+        """Return the CREATE statement this table was defined with."""
+        cursor = self._database.execute(
+            select("sql")
+            .from_(f"{self._database.name}.sqlite_schema")
+            .where("type='table'")
+            .where(f"name='{self.name}'"),
+        )
+        row = next(cursor, None)
+        return row["sql"] if row else None
 
     def difference(self, other: Table) -> Iterator[Row]:
         """Compare this table with another using SQL EXCEPT operations."""
@@ -90,6 +144,35 @@ class Table:
 
         # Add EXCEPT clause only when columns match exactly
         if self.columns == other.columns:
-            query = query.except_(select().from_(other.qualified_name))
+            if (
+                self._distinct_keys
+                and self.definition is not None
+                and self.definition == other.definition
+            ):
+                query = self._anti_join(other)
+            else:
+                query = query.except_(select().from_(other.qualified_name))
 
         return self._database.execute(query)
+
+    def _anti_join(self, other: Table) -> Query:
+        """Select rows with no identical row in other, probing its key index.
+
+        Only used when both tables share one CREATE statement, so every column
+        has the same type affinity and collation on both sides and IS compares
+        values exactly as EXCEPT does (NULLs included). The primary key must
+        keep rows distinct, as EXCEPT would, and ordering by every column returns
+        them in EXCEPT's order, but each row is found through the other table's
+        primary key instead of sorting both tables into a temporary b-tree.
+        """
+        matches = (
+            f"other.{column} IS this.{column}"
+            for column in map(escape_identifier, self.columns)
+        )
+        correlated = select().from_(f"{other.qualified_name} AS other").where(*matches)
+        return (
+            select()
+            .from_(f"{self.qualified_name} AS this")
+            .where(f"NOT EXISTS ({correlated})")
+            .order_by(*self.columns)
+        )
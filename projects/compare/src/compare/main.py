@@ -1,17 +1,18 @@
 """Main database comparison functionality."""
 
 import json
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 from sqlite3 import Row
-from typing import Any, NamedTuple
+from typing import Any, NamedTuple, cast
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from jinja2.environment import TemplateStream
 
 from compare.comparison import DatabaseDifference
-from compare.index import HierarchicalIndex, Indexer, IndexKeys
+from compare.index import HierarchicalIndex, Indexer, IndexKeys, Key
 from compare.inspection import Table
 
 
@@ -30,7 +31,11 @@ class Change(NamedTuple):
 
 
 class ChangeSet(NamedTuple):
-    """Set of changes for a table."""
+    """Set of changes for a table.
+
+    Row changes stream lazily from the database cursors, so ``changes`` can be
+    consumed only once; materialize it first when it has to be read twice.
+    """
 
     headers: Header
     changes: Iterable[Change]
@@ -68,9 +73,27 @@ def encoder(obj: object) -> tuple[Any, ...]:
     raise TypeError(msg)
 
 
+def comparisons_to_json_stream(
+    comparisons: Iterable[Comparison],
+    *,
+    ensure_ascii: bool = False,
+) -> Iterator[str]:
+    """Yield the JSON array of comparisons one table at a time.
+
+    Only one table's changes are held in memory at once, instead of the whole
+    report being encoded into a single string.
+    """
+    yield "["
+    for position, comparison in enumerate(comparisons):
+        if position:
+            yield ", "
+        yield json.dumps(comparison, default=encoder, ensure_ascii=ensure_ascii)
+    yield "]"
+
+
 def comparisons_to_json(comparisons: Iterable[Comparison], **_: str) -> str:
     """Convert comparison result to JSON string."""
-    return json.dumps(comparisons, default=encoder, ensure_ascii=False)
+    return "".join(comparisons_to_json_stream(comparisons))
 
 
 def comparisons_to_html(comparisons: Iterable[Comparison]) -> TemplateStream:
@@ -110,56 +133,76 @@ def comparisons_to_summary(comparisons: Iterable[Comparison]) -> list[dict[str,
     ]
 
 
+def _column_getter(columns: tuple[str | int, ...]) -> Callable[[Row], Key] | None:
+    """Return a getter for the tuple of values in the given columns, if any."""
+    if not columns:
+        return None
+    # itemgetter returns a bare value for a single item, the key must stay a tuple
+    if len(columns) == 1:
+        getter = itemgetter(columns[0])
+        return lambda row: (getter(row),)
+    # A multi-item itemgetter already returns a tuple, typeshed cannot say so
+    return cast("Callable[[Row], Key]", itemgetter(*columns))
+
+
 def create_row_indexer(
     primary_keys: Iterable[str],
     columns: Iterable[str],
+    *,
+    match_guid: bool = False,
+    layout: Sequence[str] | None = None,
 ) -> Indexer:
-    """Create indexer for hierarchical row matching with fixed priority levels."""
-    # Store the iterables for re-use across mutiple calls of the indexer
-    columns = tuple(columns)
-    primary_keys = tuple(primary_keys)
+    """Create indexer for hierarchical row matching with fixed priority levels.
+
+    RowGUID presence is a property of the table, not the row, so callers decide it
+    once via ``match_guid`` instead of the indexer scanning ``row.keys()`` per row.
+
+    When every indexed row shares one column ``layout``, values are read by
+    position, since looking up a Row by name scans its column names.
+    """
+    # Columns are looked up by name (str is the identity here) unless laid out
+    position: Callable[[str], str | int] = str
+    if layout is not None:
+        position = {name: index for index, name in enumerate(layout)}.__getitem__
+    guid = position("RowGUID") if match_guid else None
+
+    # Build the key getters once for re-use across mutiple calls of the indexer
+    primary_key_getter = _column_getter(tuple(map(position, primary_keys)))
+    content_getter = _column_getter(tuple(map(position, columns)))
 
     def indexer(row: Row) -> IndexKeys:
         keys: IndexKeys = []
 
         # Priority 0: RowGUID - use special key prefix to ensure unique priority level
-        if guid := row["RowGUID"] if "RowGUID" in row.keys() else None:  # noqa: SIM118
-            keys.append(("GUID", (guid,)))
+        if guid is not None and (guid_value := row[guid]):
+            keys.append(("GUID", (guid_value,)))
 
         # Priority 1: Primary keys - use special key prefix
-        if primary_key_values := tuple(row[column] for column in primary_keys):
-            keys.append(("PK", primary_key_values))
+        if primary_key_getter:
+            keys.append(("PK", primary_key_getter(row)))
 
         # Priority 2: Full content - use special key prefix
-        if content_values := tuple(row[column] for column in columns):
-            keys.append(("CONTENT", content_values))
+        if content_getter:
+            keys.append(("CONTENT", content_getter(row)))
 
         return keys
 
     return indexer
 
 
-def schema_indexer(row: Row) -> IndexKeys:
-    """Indexer for schema/column comparisons."""
-    keys: IndexKeys = []
-
-    # Priority 0: Column name (primary matching criterion)
-    column_name = row["name"]
-    keys.append(("SCHEMA", (column_name,)))
-
-    return keys
-
-
 def compare_rows(
     old: Iterator[Row],
     new: Iterator[Row],
     indexer: Indexer,
+    old_indexer: Indexer | None = None,
 ) -> Iterator[Change]:
-    """Hierarchical matching: build index for new rows, match old rows."""
+    """Hierarchical matching: build index for new rows, match old rows.
+
+    Old rows are keyed with ``old_indexer`` when their layout differs from new.
+    """
     # Build hierarchical index
-    index = HierarchicalIndex(indexer)
-    for row in new:
-        index.add(row)
+    index = HierarchicalIndex(indexer, old_indexer)
+    index.extend(new)
 
     # Match each old row to best available new row
     for old_row in old:
@@ -175,27 +218,63 @@ def compare_rows(
 
 def compare_contents(old_table: Table, new_table: Table) -> ChangeSet:
     """Compare content tables and return complete ChangeSet."""
-    shared_columns = intersection(old_table.columns, new_table.columns) - {"RowGUID"}
-    shared_primary_keys = intersection(old_table.primary_keys, new_table.primary_keys)
-    content_indexer = create_row_indexer(shared_primary_keys, shared_columns)
+    # Fix the key column order once so both sides build comparable keys
+    shared_columns = tuple(
+        intersection(old_table.columns, new_table.columns) - {"RowGUID"},
+    )
+    shared_primary_keys = tuple(
+        intersection(old_table.primary_keys, new_table.primary_keys),
+    )
+    # A GUID key can only ever match when both sides carry the column
+    match_guid = "RowGUID" in old_table.columns and "RowGUID" in new_table.columns
+
+    # Each side yields rows in its own column order, so index both by position
+    new_indexer = create_row_indexer(
+        shared_primary_keys,
+        shared_columns,
+        match_guid=match_guid,
+        layout=new_table.columns,
+    )
+    old_indexer = None
+    if old_table.columns != new_table.columns:
+        old_indexer = create_row_indexer(
+            shared_primary_keys,
+            shared_columns,
+            match_guid=match_guid,
+            layout=old_table.columns,
+        )
 
     old_rows = old_table.difference(new_table)
     new_rows = new_table.difference(old_table)
 
     return ChangeSet(
         headers=Header(old=old_table.columns, new=new_table.columns),
-        changes=compare_rows(old_rows, new_rows, content_indexer),
+        changes=compare_rows(old_rows, new_rows, new_indexer, old_indexer),
     )
 
 
+def compare_columns(old: Iterator[Row], new: Iterator[Row]) -> Iterator[Change]:
+    """Single pass over schema rows matched by column name."""
+    new_by_name = {row["name"]: row for row in new}
+
+    for old_row in old:
+        new_row = new_by_name.pop(old_row["name"], None)
+        if new_row is None:
+            yield Change(old=old_row)
+        elif new_row != old_row:
+            yield Change(old=old_row, new=new_row)
+
+    # Emit all remaining new columns as additions
+    for new_row in new_by_name.values():
+        yield Change(new=new_row)
+
+
 def compare_schemas(old_table: Table, new_table: Table) -> ChangeSet:
     """Compare schema tables and return complete ChangeSet."""
-    old_rows = old_table.difference(new_table)
-    new_rows = new_table.difference(old_table)
-
     return ChangeSet(
         headers=Header(old=old_table.columns, new=new_table.columns),
-        changes=compare_rows(old_rows, new_rows, schema_indexer),
+        # Column lists are small, materialize them rather than keep a live cursor
+        changes=tuple(compare_columns(old_table.rows, new_table.rows)),
     )
 
 
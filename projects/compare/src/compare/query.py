@@ -26,11 +26,21 @@ def attach(database_uri: str, alias: str) -> str:
     return f"ATTACH '{database_uri}' AS {alias}"
 
 
+def pragma(name: str, value: str | int, schema: str = "main") -> str:
+    """Generate a PRAGMA assignment for the given schema."""
+    return f"PRAGMA {escape_identifier(schema)}.{name} = {value}"
+
+
 def pragma_table_info(table: str, schema: str = "main") -> str:
     """Generate a pragma_table_info function call."""
     return f"pragma_table_info('{table}', '{schema}')"
 
 
+def pragma_index_list(table: str, schema: str = "main") -> str:
+    """Generate a pragma_index_list function call."""
+    return f"pragma_index_list('{table}', '{schema}')"
+
+
 def qualified_table(table: str, schema: str = "main") -> str:
     """Generate a qualified table name with proper escaping."""
     return f"{escape_identifier(schema)}.{escape_identifier(table)}"
@@ -45,6 +55,7 @@ class Query:
         self._table: str | None = None
         self._where: list[str] = []
         self._except: Query | None = None
+        self._order_by: tuple[str, ...] = ()
 
     def from_(self, table: str) -> Query:
         """Set the FROM clause."""
@@ -61,6 +72,11 @@ class Query:
         self._except = other
         return self
 
+    def order_by(self, *columns: str) -> Query:
+        """Set the ORDER BY columns."""
+        self._order_by = columns
+        return self
+
     def __str__(self) -> str:
         """Convert the query to SQL string."""
         if not self._table:
@@ -75,5 +91,7 @@ class Query:
             query += f" WHERE {' AND '.join(self._where)}"
         if self._except:
             query += f" EXCEPT {self._except}"
+        if self._order_by:
+            query += f" ORDER BY {', '.join(map(parse_column, self._order_by))}"
 
         return query
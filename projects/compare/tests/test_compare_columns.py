@@ -0,0 +1,44 @@
+"""Tests for single-pass schema column comparison."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+from compare.main import compare_databases
+
+
+def test_column_changes_by_name(database_factory: Callable[..., Path]) -> None:
+    """Columns are matched by name into added, removed and modified changes."""
+    old_db = database_factory(
+        "old.db",
+        "CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT, legacy TEXT)",
+    )
+    new_db = database_factory(
+        "new.db",
+        "CREATE TABLE t (id INTEGER PRIMARY KEY, name INTEGER, extra TEXT)",
+    )
+
+    comparison = next(iter(compare_databases(old_db, new_db)))
+    changes = {
+        (
+            change.old["name"] if change.old else None,
+            change.new["name"] if change.new else None,
+        )
+        for change in comparison.body.columns.changes
+    }
+
+    assert changes == {("name", "name"), ("legacy", None), (None, "extra")}
+    # Schema changes are materialized and can be read again
+    assert len(list(comparison.body.columns.changes)) == 3
+
+
+def test_identical_schemas_have_no_column_changes(
+    database_factory: Callable[..., Path],
+) -> None:
+    """Unchanged columns are not reported."""
+    ddl = "CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)"
+    old_db = database_factory("old.db", ddl)
+    new_db = database_factory("new.db", ddl)
+
+    comparison = next(iter(compare_databases(old_db, new_db)))
+
+    assert list(comparison.body.columns.changes) == []
@@ -0,0 +1,22 @@
+"""Tests for the attached-database comparison context."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+from compare.comparison import DatabaseDifference
+
+TABLE_DDL = "CREATE TABLE t (id INTEGER PRIMARY KEY)"
+
+
+def test_read_pragmas_applied(database_factory: Callable[..., Path]) -> None:
+    """Attached databases get the read-oriented cache and temp settings."""
+    difference = DatabaseDifference(
+        database_factory("old.db", TABLE_DDL),
+        database_factory("new.db", TABLE_DDL),
+    )
+    connection = difference._connection  # noqa: SLF001
+
+    assert connection.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+    for name in ("old", "new"):
+        cache_size = connection.execute(f"PRAGMA {name}.cache_size").fetchone()[0]
+        assert cache_size == DatabaseDifference.CACHE_SIZE
@@ -0,0 +1,93 @@
+"""Tests for the hierarchical row index."""
+
+import sqlite3
+from collections.abc import Callable
+
+from compare.index import HierarchicalIndex, IndexKeys
+
+# Rows with an id and a code column, as many as the LIMIT parameter
+NUMBERED_ROWS = (
+    "WITH RECURSIVE n(id) AS (SELECT 1 UNION ALL SELECT id + 1 FROM n LIMIT ?) "
+    "SELECT id, 'c' || (id % 2) AS code FROM n"
+)
+
+
+def id_indexer(row: sqlite3.Row) -> IndexKeys:
+    """Index rows by id first, then by code."""
+    return [("ID", (row["id"],)), ("CODE", (row["code"],))]
+
+
+def test_pop_matches_and_removes_group(
+    select_rows: Callable[..., list[sqlite3.Row]],
+) -> None:
+    """A popped row is no longer matchable through any of its keys."""
+    first, second, third = select_rows(NUMBERED_ROWS, 3)
+    index = HierarchicalIndex(id_indexer)
+    for row in (first, second, third):
+        index.add(row)
+
+    assert index.pop(second) is second
+    assert index.pop(second) is None
+    assert list(index) == [first, third]
+
+
+def test_pop_falls_back_to_lower_priority_key(
+    select_rows: Callable[..., list[sqlite3.Row]],
+) -> None:
+    """A row without an id match is paired on its next key."""
+    rows = select_rows(NUMBERED_ROWS, 4)
+    index = HierarchicalIndex(id_indexer)
+    index.add(rows[0])
+
+    # rows[2] has a different id but shares code 'c1' with rows[0]
+    assert index.pop(rows[2]) is rows[0]
+    assert list(index) == []
+
+
+def test_iteration_keeps_insertion_order(
+    select_rows: Callable[..., list[sqlite3.Row]],
+) -> None:
+    """Unmatched rows are yielded in the order they were added."""
+    rows = select_rows(NUMBERED_ROWS, 5)
+    index = HierarchicalIndex(id_indexer)
+    for row in rows:
+        index.add(row)
+
+    index.pop(rows[0])
+    index.pop(rows[3])
+
+    assert [row["id"] for row in index] == [2, 3, 5]
+
+
+def test_extend_matches_repeated_add(
+    select_rows: Callable[..., list[sqlite3.Row]],
+) -> None:
+    """Bulk insertion builds the same index as adding rows one by one."""
+    rows = select_rows(NUMBERED_ROWS, 6)
+    added = HierarchicalIndex(id_indexer)
+    for row in rows[:2]:
+        added.add(row)
+    for row in rows[2:]:
+        added.add(row)
+    extended = HierarchicalIndex(id_indexer)
+    extended.add(rows[0])
+    extended.extend(rows[1:])
+
+    for probe in (rows[4], rows[1]):
+        assert added.pop(probe) is extended.pop(probe)
+    assert list(added) == list(extended)
+
+
+def test_probe_indexer_keys_popped_rows(
+    select_rows: Callable[..., list[sqlite3.Row]],
+) -> None:
+    """Rows passed to pop are keyed with the probe indexer when one is given."""
+    rows = select_rows(NUMBERED_ROWS, 3)
+    index = HierarchicalIndex(
+        lambda row: [("ID", (row[0],))],
+        probe_indexer=lambda row: [("ID", (row[0] + 1,))],
+    )
+    index.extend(rows)
+
+    # The probe reads id 1 as 2, matching the second indexed row
+    assert index.pop(rows[0]) is rows[1]
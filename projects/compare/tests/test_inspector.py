@@ -463,3 +463,179 @@ def test_reserved_keyword_in_attached_schema() -> None:
     assert cols == ["id", "total"]
 
     conn.close()
+
+
+def test_table_metadata_is_memoized(simple_db: Connection) -> None:
+    """Test that tables, schema tables and key columns are built once."""
+    database = Database(simple_db)
+    table = database.table("users")
+
+    assert database.table("users") is table
+    assert database.tables is database.tables
+    assert table.schema is table.schema
+    assert table.primary_keys is table.primary_keys
+
+
+def create_attached_tables(
+    old_ddl: str,
+    new_ddl: str,
+    old_rows: list[tuple[object, ...]],
+    new_rows: list[tuple[object, ...]],
+) -> Connection:
+    """Create table t in attached old and new databases, as compare does."""
+    conn = connect(":memory:")
+    for schema, ddl, rows in (("old", old_ddl, old_rows), ("new", new_ddl, new_rows)):
+        conn.execute(f"ATTACH ':memory:' AS {schema}")
+        conn.execute(f"CREATE TABLE {schema}.t {ddl}")
+        placeholders = ", ".join("?" * len(rows[0]))
+        conn.executemany(f"INSERT INTO {schema}.t VALUES ({placeholders})", rows)  # noqa: S608
+    return conn
+
+
+OLD_ROWS: list[tuple[object, ...]] = [
+    (4, "d", None),
+    (3, "c", 2.0),
+    (2, "b", 1.5),
+    (1, "a", None),
+]
+NEW_ROWS: list[tuple[object, ...]] = [
+    (1, "a", None),
+    (2, "b", 9.9),
+    (4, "d", 0.0),
+    (5, "e", None),
+]
+CHANGED_ROWS: list[tuple[object, ...]] = [(2, "b", 1.5), (3, "c", 2.0), (4, "d", None)]
+# Nullable primary key columns of rowid tables accept duplicate rows
+DUPLICATE_ROWS: list[tuple[object, ...]] = [
+    (None, None, 1),
+    (None, None, 1),
+    (1, "a", 2),
+]
+
+
+@pytest.mark.parametrize(
+    ("ddl", "old_rows", "new_rows", "expected"),
+    [
+        (
+            "(id INTEGER PRIMARY KEY, name TEXT, score REAL)",
+            OLD_ROWS,
+            NEW_ROWS,
+            CHANGED_ROWS,
+        ),
+        (
+            "(id INTEGER, name TEXT, score REAL, PRIMARY KEY (id, name))",
+            OLD_ROWS,
+            NEW_ROWS,
+            CHANGED_ROWS,
+        ),
+        (
+            "(id INTEGER, name TEXT, score REAL, PRIMARY KEY (id, name)) WITHOUT ROWID",
+            OLD_ROWS,
+            NEW_ROWS,
+            CHANGED_ROWS,
+        ),
+        ("(id INTEGER, name TEXT, score REAL)", OLD_ROWS, NEW_ROWS, CHANGED_ROWS),
+        (
+            "(a TEXT, b TEXT, v INT, PRIMARY KEY (a, b))",
+            DUPLICATE_ROWS,
+            [(1, "a", 2)],
+            [(None, None, 1)],
+        ),
+        (
+            "(a INTEGER PRIMARY KEY DESC, b TEXT, v INT)",
+            DUPLICATE_ROWS,
+            [(1, "a", 2)],
+            [(None, None, 1)],
+        ),
+    ],
+)
+def test_difference_matches_except(
+    ddl: str,
+    old_rows: list[tuple[object, ...]],
+    new_rows: list[tuple[object, ...]],
+    expected: list[tuple[object, ...]],
+) -> None:
+    """Test that difference returns exactly the EXCEPT rows, NULLs included."""
+    conn = create_attached_tables(ddl, ddl, old_rows, new_rows)
+    old = Database(conn, "old").table("t")
+    new = Database(conn, "new").table("t")
+
+    removed = [tuple(row) for row in old.difference(new)]
+    added = [tuple(row) for row in new.difference(old)]
+    except_old = "SELECT * FROM old.t EXCEPT SELECT * FROM new.t"
+    except_new = "SELECT * FROM new.t EXCEPT SELECT * FROM old.t"
+
+    # Same rows in the same order, which decides how rows are paired later
+    assert removed == [tuple(row) for row in conn.execute(except_old)]
+    assert added == [tuple(row) for row in conn.execute(except_new)]
+    assert removed == expected
+    conn.close()
+
+
+def test_difference_probes_key_index_for_identical_tables() -> None:
+    """Test that identically defined keyed tables use the anti-join."""
+    ddl = "(id INTEGER PRIMARY KEY, name TEXT)"
+    conn = create_attached_tables(ddl, ddl, [(1, "a")], [(1, "b")])
+    statements: list[str] = []
+    conn.set_trace_callback(statements.append)
+    old = Database(conn, "old").table("t")
+
+    assert [tuple(row) for row in old.difference(Database(conn, "new").table("t"))] == [
+        (1, "a"),
+    ]
+    assert any("NOT EXISTS" in sql for sql in statements)
+    assert not any("EXCEPT" in sql for sql in statements)
+    conn.close()
+
+
+@pytest.mark.parametrize(
+    ("old_ddl", "new_ddl", "old_rows", "new_rows"),
+    [
+        pytest.param(
+            "(id INTEGER PRIMARY KEY, code TEXT)",
+            "(id INTEGER PRIMARY KEY, code INTEGER)",
+            [(1, "007"), (2, "2")],
+            [(1, 7), (2, 2)],
+            id="type-change",
+        ),
+        pytest.param(
+            "(id INTEGER PRIMARY KEY, name TEXT COLLATE NOCASE)",
+            "(id INTEGER PRIMARY KEY, name TEXT)",
+            [(1, "Alpha"), (2, "beta")],
+            [(1, "alpha"), (2, "BETA")],
+            id="collation-change",
+        ),
+    ],
+)
+def test_difference_matches_except_across_definitions(
+    old_ddl: str,
+    new_ddl: str,
+    old_rows: list[tuple[object, ...]],
+    new_rows: list[tuple[object, ...]],
+) -> None:
+    """Test that affinity and collation changes are compared like EXCEPT."""
+    conn = create_attached_tables(old_ddl, new_ddl, old_rows, new_rows)
+    old = Database(conn, "old").table("t")
+    new = Database(conn, "new").table("t")
+
+    removed = [tuple(row) for row in old.difference(new)]
+    added = [tuple(row) for row in new.difference(old)]
+    except_old = "SELECT * FROM old.t EXCEPT SELECT * FROM new.t"
+    except_new = "SELECT * FROM new.t EXCEPT SELECT * FROM old.t"
+
+    assert removed == [tuple(row) for row in conn.execute(except_old)]
+    assert added == [tuple(row) for row in conn.execute(except_new)]
+    # Binary comparison against the new definition sees every row as changed
+    assert added == new_rows
+    conn.close()
+
+
+def test_columns_and_primary_keys_share_one_schema_scan(simple_db: Connection) -> None:
+    """Test that columns and primary keys come from a single pragma query."""
+    statements: list[str] = []
+    simple_db.set_trace_callback(statements.append)
+    table = Database(simple_db).table("users")
+
+    assert table.columns == ("id", "name", "email", "age")
+    assert table.primary_keys == ("id",)
+    assert sum("pragma_table_info" in sql for sql in statements) == 1
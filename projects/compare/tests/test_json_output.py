@@ -0,0 +1,32 @@
+"""Tests for streamed JSON output of comparisons."""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+from compare.main import compare_databases, comparisons_to_json_stream, encoder
+
+
+def test_json_stream_matches_single_dump(database_factory: Callable[..., Path]) -> None:
+    """Streaming JSON output joins to the same text as one json.dumps call."""
+    old_db = database_factory("old.db", "CREATE TABLE t (id INTEGER, x TEXT)")
+    new_db = database_factory(
+        "new.db",
+        "CREATE TABLE t (id INTEGER, é TEXT)",
+        "CREATE TABLE added (id INTEGER)",
+    )
+
+    streamed = "".join(comparisons_to_json_stream(compare_databases(old_db, new_db)))
+    expected = json.dumps(
+        compare_databases(old_db, new_db),
+        default=encoder,
+        ensure_ascii=False,
+    )
+
+    assert streamed == expected
+    assert len(json.loads(streamed)) == 2
+
+
+def test_json_stream_of_no_comparisons_is_empty_array() -> None:
+    """An empty comparison yields an empty JSON array."""
+    assert "".join(comparisons_to_json_stream([])) == "[]"
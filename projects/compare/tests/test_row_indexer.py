@@ -0,0 +1,75 @@
+"""Tests for the content row indexer."""
+
+import sqlite3
+from collections.abc import Callable
+
+from compare.main import create_row_indexer
+
+
+def test_indexer_keys_by_guid_pk_and_content(
+    select_rows: Callable[..., list[sqlite3.Row]],
+) -> None:
+    """GUID, primary key and content keys are emitted in priority order."""
+    row = select_rows("SELECT 'g-1' AS RowGUID, 1 AS id, 'a' AS name")[0]
+    indexer = create_row_indexer(["id"], ["id", "name"], match_guid=True)
+
+    assert indexer(row) == [
+        ("GUID", ("g-1",)),
+        ("PK", (1,)),
+        ("CONTENT", (1, "a")),
+    ]
+
+
+def test_indexer_skips_guid_when_not_matched(
+    select_rows: Callable[..., list[sqlite3.Row]],
+) -> None:
+    """Without match_guid the RowGUID column is never read."""
+    row = select_rows("SELECT 'g-1' AS RowGUID, 1 AS id")[0]
+    indexer = create_row_indexer(["id"], ["id"])
+
+    assert indexer(row) == [("PK", (1,)), ("CONTENT", (1,))]
+
+
+def test_indexer_skips_null_guid(select_rows: Callable[..., list[sqlite3.Row]]) -> None:
+    """A NULL RowGUID falls through to the primary key level."""
+    row = select_rows("SELECT NULL AS RowGUID, 1 AS id")[0]
+    indexer = create_row_indexer(["id"], ["id"], match_guid=True)
+
+    assert indexer(row) == [("PK", (1,)), ("CONTENT", (1,))]
+
+
+def test_indexer_keys_stay_tuples_for_single_columns(
+    select_rows: Callable[..., list[sqlite3.Row]],
+) -> None:
+    """Single-column keys are still wrapped in a tuple."""
+    row = select_rows("SELECT 7 AS id, 'x' AS name")[0]
+    indexer = create_row_indexer(["id"], ["name"])
+
+    assert indexer(row) == [("PK", (7,)), ("CONTENT", ("x",))]
+
+
+def test_indexer_without_columns_emits_no_keys(
+    select_rows: Callable[..., list[sqlite3.Row]],
+) -> None:
+    """A table with no shared columns or keys produces no index keys."""
+    row = select_rows("SELECT 1 AS id")[0]
+
+    assert create_row_indexer([], [])(row) == []
+
+
+def test_indexer_layout_matches_name_lookup(
+    select_rows: Callable[..., list[sqlite3.Row]],
+) -> None:
+    """Positional lookup through a layout yields the same keys as names."""
+    row = select_rows("SELECT 'g-1' AS RowGUID, 1 AS id, 'a' AS name")[0]
+    layout = ("RowGUID", "id", "name")
+
+    by_name = create_row_indexer(["id"], ["name", "id"], match_guid=True)
+    by_position = create_row_indexer(
+        ["id"],
+        ["name", "id"],
+        match_guid=True,
+        layout=layout,
+    )
+
+    assert by_position(row) == by_name(row)
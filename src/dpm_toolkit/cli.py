@@ -289,6 +289,7 @@ def compare(old_location: Path, new_location: Path, fmt: Format = "table") -> No
         from compare import (
             compare_databases,
             comparisons_to_html,
+            comparisons_to_json_stream,
             comparisons_to_summary,
         )
     except ImportError:
@@ -320,7 +321,9 @@ def compare(old_location: Path, new_location: Path, fmt: Format = "table") -> No
             stdout.write(chunk)
 
     if fmt == "json":
-        stdout.write(dumps(comparisons, default=serializer))
+        # Stream table by table so large diffs are never one string in memory
+        for chunk in comparisons_to_json_stream(comparisons, ensure_ascii=True):
+            stdout.write(chunk)
 
     if fmt == "table":
         comparison_summary = comparisons_to_summary(comparisons)